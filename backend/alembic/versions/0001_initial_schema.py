@@ -0,0 +1,61 @@
+"""Initial schema (string IDs, naive timestamps)
+
+Matches the tables the original app created with create_all(). Tables
+that already exist are left alone, so databases created before Alembic
+was introduced can simply run `alembic upgrade head`.
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_initial_schema"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "ml_models" not in existing:
+        op.create_table(
+            "ml_models",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("name", sa.String(100), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("framework", sa.String(20), nullable=False),
+            sa.Column("status", sa.String(20), nullable=False),
+            sa.Column("current_version", sa.String(20), nullable=True),
+            sa.Column("metrics", sa.JSON(), nullable=True),
+            sa.Column("tags", sa.JSON(), nullable=True),
+            sa.Column("author", sa.String(100), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_ml_models_name", "ml_models", ["name"], unique=True)
+
+    if "model_versions" not in existing:
+        op.create_table(
+            "model_versions",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column(
+                "model_id",
+                sa.String(36),
+                sa.ForeignKey("ml_models.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("version", sa.String(20), nullable=False),
+            sa.Column("metrics", sa.JSON(), nullable=True),
+            sa.Column("changelog", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("model_versions")
+    op.drop_index("ix_ml_models_name", table_name="ml_models")
+    op.drop_table("ml_models")
@@ -0,0 +1,244 @@
+"""Native UUID IDs, server-side timestamps, version uniqueness and indexes
+
+- ml_models.id, model_versions.id/model_id: 36-char strings become native
+  UUIDs on PostgreSQL and 16-byte values on SQLite (the GUID column type)
+- created_at/updated_at: timezone-aware on PostgreSQL, with database-side
+  defaults on both dialects
+- uq_model_versions_model_id_version, required by the
+  ON CONFLICT (model_id, version) insert in VersionService
+- Composite list/version indexes and, on PostgreSQL, trigram search indexes
+
+Each step checks the current schema first, so databases that create_all()
+already built at the current schema are left unchanged.
+
+Revision ID: 0002_uuid_ids_and_constraints
+Revises: 0001_initial_schema
+Create Date: 2026-10-15
+"""
+
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0002_uuid_ids_and_constraints"
+down_revision = "0001_initial_schema"
+branch_labels = None
+depends_on = None
+
+_ID_COLUMNS = [
+    ("ml_models", "id"),
+    ("model_versions", "id"),
+    ("model_versions", "model_id"),
+]
+_TIMESTAMP_COLUMNS = [
+    ("ml_models", "created_at"),
+    ("ml_models", "updated_at"),
+    ("model_versions", "created_at"),
+]
+_INDEXES = [
+    ("ix_ml_models_status_updated_at", "ml_models", ["status", "updated_at"]),
+    ("ix_ml_models_framework_updated_at", "ml_models", ["framework", "updated_at"]),
+    (
+        "ix_model_versions_model_id_created_at",
+        "model_versions",
+        ["model_id", "created_at"],
+    ),
+]
+_TRGM_INDEXES = [
+    ("ix_ml_models_name_trgm", "name"),
+    ("ix_ml_models_description_trgm", "description"),
+]
+_VERSION_UNIQUE = "uq_model_versions_model_id_version"
+_VERSION_FK = "model_versions_model_id_fkey"
+_SQLITE_NOW = sa.text("(STRFTIME('%Y-%m-%d %H:%M:%f', 'NOW'))")
+
+
+def _column(inspector, table: str, name: str) -> dict:
+    return next(c for c in inspector.get_columns(table) if c["name"] == name)
+
+
+def _has_string_ids(inspector) -> bool:
+    return isinstance(_column(inspector, "ml_models", "id")["type"], sa.String)
+
+
+def _has_version_unique(inspector) -> bool:
+    names = {uc["name"] for uc in inspector.get_unique_constraints("model_versions")}
+    return _VERSION_UNIQUE in names
+
+
+def _rewrite_ids(bind, convert) -> None:
+    """Rewrite every ID value in place with convert(old) -> new."""
+    for table, column in _ID_COLUMNS:
+        values = bind.execute(
+            sa.text(f"SELECT DISTINCT {column} FROM {table}")
+        ).scalars()
+        params = [{"old": value, "new": convert(value)} for value in values]
+        if params:
+            bind.execute(
+                sa.text(f"UPDATE {table} SET {column} = :new WHERE {column} = :old"),
+                params,
+            )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        _upgrade_postgresql(bind)
+    else:
+        _upgrade_sqlite(bind)
+
+    inspector = sa.inspect(bind)
+    for name, table, columns in _INDEXES:
+        if name not in {ix["name"] for ix in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+    if bind.dialect.name == "postgresql":
+        existing = {ix["name"] for ix in inspector.get_indexes("ml_models")}
+        for name, column in _TRGM_INDEXES:
+            if name not in existing:
+                op.create_index(
+                    name,
+                    "ml_models",
+                    [column],
+                    postgresql_using="gin",
+                    postgresql_ops={column: "gin_trgm_ops"},
+                )
+
+
+def _upgrade_postgresql(bind) -> None:
+    inspector = sa.inspect(bind)
+
+    if _has_string_ids(inspector):
+        for fk in inspector.get_foreign_keys("model_versions"):
+            if fk["referred_table"] == "ml_models":
+                op.drop_constraint(fk["name"], "model_versions", type_="foreignkey")
+        for table, column in _ID_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.UUID(as_uuid=True),
+                existing_nullable=False,
+                postgresql_using=f"{column}::uuid",
+            )
+        op.create_foreign_key(
+            _VERSION_FK,
+            "model_versions",
+            "ml_models",
+            ["model_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+
+    for table, column in _TIMESTAMP_COLUMNS:
+        # Existing naive values were written with datetime.utcnow()
+        if not _column(inspector, table, column)["type"].timezone:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+        op.alter_column(
+            table,
+            column,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            existing_nullable=False,
+        )
+
+    if not _has_version_unique(inspector):
+        op.create_unique_constraint(
+            _VERSION_UNIQUE, "model_versions", ["model_id", "version"]
+        )
+
+    # Required by the trigram indexes
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
+def _upgrade_sqlite(bind) -> None:
+    inspector = sa.inspect(bind)
+
+    # Values only: the declared VARCHAR(36) stays, since a batch type change
+    # would CAST the values; SQLite stores the 16-byte BLOBs as-is
+    if _has_string_ids(inspector):
+        _rewrite_ids(bind, lambda value: uuid.UUID(value).bytes)
+
+    # SQLite cannot ALTER defaults or add constraints; batch rebuilds tables
+    missing_defaults = {
+        (table, column)
+        for table, column in _TIMESTAMP_COLUMNS
+        if _column(inspector, table, column)["default"] is None
+    }
+    has_version_unique = _has_version_unique(inspector)
+
+    for table in ("ml_models", "model_versions"):
+        columns = [c for t, c in sorted(missing_defaults) if t == table]
+        add_unique = table == "model_versions" and not has_version_unique
+        if not columns and not add_unique:
+            continue
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    server_default=_SQLITE_NOW,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                )
+            if add_unique:
+                batch_op.create_unique_constraint(
+                    _VERSION_UNIQUE, ["model_id", "version"]
+                )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+
+    for name, table, _ in _INDEXES:
+        op.drop_index(name, table_name=table)
+
+    if is_postgresql:
+        for name, _ in _TRGM_INDEXES:
+            op.drop_index(name, table_name="ml_models")
+        op.drop_constraint(_VERSION_UNIQUE, "model_versions", type_="unique")
+        op.drop_constraint(_VERSION_FK, "model_versions", type_="foreignkey")
+        for table, column in _ID_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.String(36),
+                existing_nullable=False,
+                postgresql_using=f"{column}::text",
+            )
+        op.create_foreign_key(
+            None, "model_versions", "ml_models", ["model_id"], ["id"], ondelete="CASCADE"
+        )
+        for table, column in _TIMESTAMP_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(),
+                server_default=None,
+                existing_nullable=False,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+        return
+
+    _rewrite_ids(bind, lambda value: str(uuid.UUID(bytes=value)))
+    with op.batch_alter_table("ml_models") as batch_op:
+        for column in ("created_at", "updated_at"):
+            batch_op.alter_column(
+                column,
+                server_default=None,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+            )
+    with op.batch_alter_table("model_versions") as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            server_default=None,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+        )
+        batch_op.drop_constraint(_VERSION_UNIQUE, type_="unique")
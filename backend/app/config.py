@@ -6,7 +6,19 @@ Supports environment variables and .env files.
 from functools import lru_cache
 from typing import Optional
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy import make_url
+
+# Sync drivers (as found in platform-provided or older DATABASE_URLs)
+# mapped to the async driver the engine requires
+_ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
 
 
 class Settings(BaseSettings):
@@ -21,7 +33,26 @@ class Settings(BaseSettings):
     api_v1_prefix: str = "/api/v1"
 
     # Database
-    database_url: str = "sqlite:///./ml_registry.db"
+    database_url: str = "sqlite+aiosqlite:///./ml_registry.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle: int = 3600  # seconds
+    db_pool_timeout: int = 30  # seconds
+
+    @field_validator("database_url")
+    @classmethod
+    def use_async_driver(cls, v: str) -> str:
+        """Rewrite sync driver URLs (e.g. postgresql://) to their async driver."""
+        url = make_url(v)
+        drivername = _ASYNC_DRIVERS.get(url.drivername)
+        if drivername is None:
+            return v
+        return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+    # Response cache (GET /models and GET /stats)
+    response_cache_max_entries: int = 256
+    response_cache_models_ttl: int = 10  # seconds
+    response_cache_stats_ttl: int = 30  # seconds
 
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:5173"]
@@ -30,6 +61,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,  # cached via get_settings(); must not drift at runtime
     )
 
 
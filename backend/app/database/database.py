@@ -3,47 +3,64 @@ Database configuration and session management.
 Supports both SQLite (development) and PostgreSQL (production).
 """
 
-from sqlalchemy import create_engine
+from collections.abc import AsyncIterator
+
+from sqlalchemy import make_url, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
 
 # Create engine based on environment
 if settings.database_url.startswith("sqlite"):
-    engine = create_engine(
+    # An in-memory database only lives as long as its connection, so all
+    # sessions must share one (e.g. the test suite)
+    in_memory = make_url(settings.database_url).database in (None, "", ":memory:")
+    engine = create_async_engine(
         settings.database_url,
         connect_args={"check_same_thread": False},  # SQLite specific
         echo=settings.debug,
+        **({"poolclass": StaticPool} if in_memory else {}),
     )
 else:
     # PostgreSQL or other databases
-    engine = create_engine(
+    engine = create_async_engine(
         settings.database_url,
         echo=settings.debug,
         pool_pre_ping=True,  # Verify connections before use
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_timeout=settings.db_pool_timeout,
     )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 Base = declarative_base()
 
 
-def get_db():
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
     Dependency that provides a database session.
     Ensures proper cleanup after request completion.
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db():
+async def init_db():
     """
     Initialize database tables.
     Called on application startup.
     """
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Required by the trigram search indexes on ml_models
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
@@ -8,6 +8,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
 from app.database.database import init_db
@@ -15,6 +16,11 @@ from app.routes.models import router as models_router
 from app.routes.models import stats_router
 from app.models.schemas import HealthResponse
 
+# Bind settings read by request handlers once at import time
+API_V1_PREFIX = settings.api_v1_prefix
+APP_NAME = settings.app_name
+APP_VERSION = settings.app_version
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -23,55 +29,73 @@ async def lifespan(app: FastAPI):
     Initializes database on startup.
     """
     # Startup
-    init_db()
+    await init_db()
     yield
     # Shutdown (cleanup if needed)
 
 
-app = FastAPI(
-    title=settings.app_name,
-    description="API for managing ML models, versions, and deployments",
-    version=settings.app_version,
-    lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
-# Health check endpoint
-@app.get("/health", response_model=HealthResponse, tags=["health"])
-def health_check():
+async def health_check():
     """Health check endpoint."""
-    return HealthResponse(status="healthy", version=settings.app_version)
-
+    return HealthResponse(status="healthy", version=APP_VERSION)
 
-# Include routers
-app.include_router(models_router, prefix=settings.api_v1_prefix)
-app.include_router(stats_router, prefix=settings.api_v1_prefix)
 
-
-# Root endpoint
-@app.get("/", tags=["root"])
-def root():
+async def root():
     """Root endpoint with API information."""
     return {
-        "name": settings.app_name,
-        "version": settings.app_version,
+        "name": APP_NAME,
+        "version": APP_VERSION,
         "docs": "/docs",
         "health": "/health",
     }
 
 
+def create_app(include_middleware: bool = True) -> FastAPI:
+    """
+    Build the FastAPI application.
+
+    Args:
+        include_middleware: Install CORS middleware. The test suite builds
+            the app without it since no test depends on CORS headers.
+    """
+    app = FastAPI(
+        title=APP_NAME,
+        description="API for managing ML models, versions, and deployments",
+        version=APP_VERSION,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/openapi.json",
+    )
+
+    # Configure CORS
+    if include_middleware:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=settings.cors_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    # Health check endpoint
+    app.add_api_route(
+        "/health", health_check, response_model=HealthResponse, tags=["health"]
+    )
+
+    # Include routers
+    app.include_router(models_router, prefix=API_V1_PREFIX)
+    app.include_router(stats_router, prefix=API_V1_PREFIX)
+
+    # Root endpoint
+    app.add_api_route("/", root, tags=["root"])
+
+    return app
+
+
+app = create_app()
+
+
 if __name__ == "__main__":
     import uvicorn
 
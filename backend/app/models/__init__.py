@@ -13,6 +13,7 @@ from app.models.schemas import (
     ModelVersionResponse,
     DashboardStats,
     HealthResponse,
+    RecentModelResponse,
 )
 
 __all__ = [
@@ -29,4 +30,5 @@ __all__ = [
     "ModelVersionResponse",
     "DashboardStats",
     "HealthResponse",
+    "RecentModelResponse",
 ]
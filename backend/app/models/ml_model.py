@@ -2,15 +2,23 @@
 SQLAlchemy ORM models for the ML Model Registry.
 """
 
-import uuid
-from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, Column, DateTime, Enum, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from app.database.database import Base
+from app.database.types import GUID, utcnow, uuid7
 
 
 class MLModel(Base):
@@ -19,8 +27,26 @@ class MLModel(Base):
     """
 
     __tablename__ = "ml_models"
+    __table_args__ = (
+        # Filter + "ORDER BY updated_at DESC" in ModelService.get_models
+        Index("ix_ml_models_status_updated_at", "status", "updated_at"),
+        Index("ix_ml_models_framework_updated_at", "framework", "updated_at"),
+        # Trigram indexes back the ILIKE '%term%' search (PostgreSQL only)
+        Index(
+            "ix_ml_models_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_ml_models_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=uuid7)
     name = Column(String(100), unique=True, nullable=False, index=True)
     description = Column(Text, nullable=True)
     framework = Column(
@@ -37,11 +63,19 @@ class MLModel(Base):
     metrics = Column(JSON, nullable=True)
     tags = Column(JSON, nullable=True, default=list)
     author = Column(String(100), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=utcnow(), nullable=False
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=utcnow(),
+        onupdate=utcnow(),
+        nullable=False,
     )
 
+    # Fetch server-generated timestamps via RETURNING on insert and update
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     versions = relationship(
         "ModelVersion", back_populates="model", cascade="all, delete-orphan"
@@ -58,15 +92,23 @@ class ModelVersion(Base):
     """
 
     __tablename__ = "model_versions"
+    __table_args__ = (
+        UniqueConstraint("model_id", "version", name="uq_model_versions_model_id_version"),
+        Index("ix_model_versions_model_id_created_at", "model_id", "created_at"),
+    )
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(GUID, primary_key=True, default=uuid7)
     model_id = Column(
-        String(36), ForeignKey("ml_models.id", ondelete="CASCADE"), nullable=False
+        GUID, ForeignKey("ml_models.id", ondelete="CASCADE"), nullable=False
     )
     version = Column(String(20), nullable=False)
     metrics = Column(JSON, nullable=True)
     changelog = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=utcnow(), nullable=False
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
     model = relationship("MLModel", back_populates="versions")
@@ -3,9 +3,11 @@ Pydantic schemas for API request/response validation.
 These match the OpenAPI specification.
 """
 
+import re
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
+from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -33,6 +35,19 @@ class Framework(str, Enum):
 
 # ============== Model Schemas ==============
 
+# Alphanumerics, hyphens, underscores and spaces, with at least one
+# alphanumeric (separator- or whitespace-only names are rejected)
+_NAME_RE = re.compile(r"(?=.*[^\W_])[\w -]+")
+
+
+def _check_name(v: str) -> str:
+    """Validate a model name against the precompiled pattern."""
+    if not _NAME_RE.fullmatch(v):
+        raise ValueError(
+            "Name must contain only alphanumeric characters, hyphens, underscores, or spaces"
+        )
+    return v.strip()
+
 
 class ModelBase(BaseModel):
     """Base schema for model data."""
@@ -54,11 +69,7 @@ class ModelCreate(ModelBase):
     @classmethod
     def name_must_be_valid(cls, v: str) -> str:
         """Validate model name format."""
-        if not v.replace("-", "").replace("_", "").replace(" ", "").isalnum():
-            raise ValueError(
-                "Name must contain only alphanumeric characters, hyphens, underscores, or spaces"
-            )
-        return v.strip()
+        return _check_name(v)
 
 
 class ModelUpdate(BaseModel):
@@ -71,20 +82,17 @@ class ModelUpdate(BaseModel):
     @field_validator("name")
     @classmethod
     def name_must_be_valid(cls, v: Optional[str]) -> Optional[str]:
-        """Validate model name format if provided."""
+        """Validate model name format if provided (omit it to keep the name)."""
+        # Only runs for values sent by the client, so None is an explicit null
         if v is None:
-            return v
-        if not v.replace("-", "").replace("_", "").replace(" ", "").isalnum():
-            raise ValueError(
-                "Name must contain only alphanumeric characters, hyphens, underscores, or spaces"
-            )
-        return v.strip()
+            raise ValueError("Name cannot be null")
+        return _check_name(v)
 
 
 class ModelResponse(ModelBase):
     """Schema for model response."""
 
-    id: str
+    id: UUID
     status: DeploymentStatus
     current_version: Optional[str] = None
     metrics: Optional[dict[str, float]] = None
@@ -119,8 +127,8 @@ class ModelVersionCreate(BaseModel):
 class ModelVersionResponse(BaseModel):
     """Schema for version response."""
 
-    id: str
-    model_id: str
+    id: UUID
+    model_id: UUID
     version: str
     metrics: Optional[dict[str, float]] = None
     changelog: Optional[str] = None
@@ -142,13 +150,30 @@ class DeploymentRequest(BaseModel):
 # ============== Stats Schemas ==============
 
 
+class RecentModelResponse(BaseModel):
+    """Slim model summary for the dashboard (no metrics or tags)."""
+
+    id: UUID
+    name: str
+    description: Optional[str] = None
+    framework: Framework
+    status: DeploymentStatus
+    current_version: Optional[str] = None
+    author: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class DashboardStats(BaseModel):
     """Dashboard statistics response."""
 
     total_models: int
     models_by_status: dict[str, int]
     models_by_framework: dict[str, int]
-    recent_models: list[ModelResponse]
+    recent_models: list[RecentModelResponse]
 
 
 # ============== Health Check ==============
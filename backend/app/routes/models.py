@@ -3,12 +3,17 @@ API routes for ML Model operations.
 Follows the OpenAPI specification.
 """
 
-from typing import Optional
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database.database import get_db
+from app.models.ml_model import MLModel
 from app.models.schemas import (
     DeploymentRequest,
     DeploymentStatus,
@@ -20,30 +25,99 @@ from app.models.schemas import (
     ModelVersionCreate,
     ModelVersionResponse,
     DashboardStats,
+    RecentModelResponse,
 )
+from app.services.cache import CachedResponse, response_cache
 from app.services.model_service import ModelService, VersionService, StatsService
 
 router = APIRouter(prefix="/models", tags=["models"])
 
+# Validate whole result lists in pydantic-core rather than row by row
+_MODEL_LIST_ADAPTER = TypeAdapter(list[ModelResponse])
+_VERSION_LIST_ADAPTER = TypeAdapter(list[ModelVersionResponse])
+_RECENT_LIST_ADAPTER = TypeAdapter(list[RecentModelResponse])
+
+
+def _to_response(model: MLModel) -> ModelResponse:
+    """
+    Build a ModelResponse from a trusted ORM row without re-validating it.
+    Only the enum columns need converting; everything else already has the
+    schema's shape.
+    """
+    return ModelResponse.model_construct(
+        id=model.id,
+        name=model.name,
+        description=model.description,
+        framework=Framework(model.framework),
+        tags=model.tags,
+        status=DeploymentStatus(model.status),
+        current_version=model.current_version,
+        metrics=model.metrics,
+        author=model.author,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
+def _etag_response(entry: CachedResponse, if_none_match: Optional[str]) -> Response:
+    """
+    Return the cached JSON body with its ETag, or an empty 304 if the
+    client already holds that representation. Returning a Response directly
+    bypasses FastAPI's response_model validation and encoding.
+    """
+    headers = {"ETag": entry.etag}
+    if if_none_match and entry.etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=entry.body, media_type="application/json", headers=headers
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive timestamps (as stored by SQLite) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _not_modified_since(updated_at: datetime, if_modified_since: str) -> bool:
+    """
+    Check an If-Modified-Since header against a row's updated_at.
+    HTTP dates have one-second resolution, so sub-second parts are dropped.
+    Unparseable headers are ignored, as RFC 9110 requires.
+    """
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return _as_utc(updated_at).replace(microsecond=0) <= _as_utc(since)
+
 
 @router.get("", response_model=ModelListResponse)
-def list_models(
+async def list_models(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     framework: Optional[Framework] = None,
     status: Optional[DeploymentStatus] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     List all models with optional filtering and pagination.
     """
-    service = ModelService(db)
-    
     framework_value = framework.value if framework else None
     status_value = status.value if status else None
-    
-    models, total = service.get_models(
+
+    cache_key = (skip, limit, framework_value, status_value, search)
+    entry = response_cache.get("models", cache_key)
+    if entry:
+        return _etag_response(entry, if_none_match)
+
+    # A write committed while the query runs must not be cached over
+    generation = response_cache.generation
+    service = ModelService(db)
+    models, total = await service.get_models(
         skip=skip,
         limit=limit,
         framework=framework_value,
@@ -51,47 +125,75 @@ def list_models(
         search=search,
     )
 
-    return ModelListResponse(
-        items=[ModelResponse.model_validate(m) for m in models],
+    response = ModelListResponse.model_construct(
+        items=_MODEL_LIST_ADAPTER.validate_python(models, from_attributes=True),
         total=total,
         skip=skip,
         limit=limit,
     )
+    entry = response_cache.set(
+        "models",
+        cache_key,
+        response.model_dump_json().encode(),
+        ttl=settings.response_cache_models_ttl,
+        generation=generation,
+    )
+    return _etag_response(entry, if_none_match)
 
 
 @router.post("", response_model=ModelResponse, status_code=status.HTTP_201_CREATED)
-def create_model(model_data: ModelCreate, db: Session = Depends(get_db)):
+async def create_model(model_data: ModelCreate, db: AsyncSession = Depends(get_db)):
     """
     Register a new ML model.
     """
     service = ModelService(db)
 
     try:
-        model = service.create_model(model_data)
-        return ModelResponse.model_validate(model)
+        model = await service.create_model(model_data)
+        return _to_response(model)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
 @router.get("/{model_id}", response_model=ModelResponse)
-def get_model(model_id: str, db: Session = Depends(get_db)):
+async def get_model(
+    model_id: str,
+    response: Response,
+    if_modified_since: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Get a specific model by ID.
     """
     service = ModelService(db)
-    model = service.get_model_by_id(model_id)
+
+    # Conditional GET: check the timestamp alone before loading the row
+    if if_modified_since:
+        updated_at = await service.get_model_updated_at(model_id)
+        if updated_at and _not_modified_since(updated_at, if_modified_since):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={
+                    "Last-Modified": format_datetime(_as_utc(updated_at), usegmt=True)
+                },
+            )
+
+    model = await service.get_model_by_id(model_id)
 
     if not model:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Model not found"
         )
 
-    return ModelResponse.model_validate(model)
+    response.headers["Last-Modified"] = format_datetime(
+        _as_utc(cast(datetime, model.updated_at)), usegmt=True
+    )
+    return _to_response(model)
 
 
 @router.put("/{model_id}", response_model=ModelResponse)
-def update_model(
-    model_id: str, model_data: ModelUpdate, db: Session = Depends(get_db)
+async def update_model(
+    model_id: str, model_data: ModelUpdate, db: AsyncSession = Depends(get_db)
 ):
     """
     Update an existing model.
@@ -99,23 +201,23 @@ def update_model(
     service = ModelService(db)
 
     try:
-        model = service.update_model(model_id, model_data)
+        model = await service.update_model(model_id, model_data)
         if not model:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Model not found"
             )
-        return ModelResponse.model_validate(model)
+        return _to_response(model)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
 @router.delete("/{model_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_model(model_id: str, db: Session = Depends(get_db)):
+async def delete_model(model_id: str, db: AsyncSession = Depends(get_db)):
     """
     Delete a model and all its versions.
     """
     service = ModelService(db)
-    deleted = service.delete_model(model_id)
+    deleted = await service.delete_model(model_id)
 
     if not deleted:
         raise HTTPException(
@@ -124,8 +226,8 @@ def delete_model(model_id: str, db: Session = Depends(get_db)):
 
 
 @router.post("/{model_id}/deploy", response_model=ModelResponse)
-def deploy_model(
-    model_id: str, deployment: DeploymentRequest, db: Session = Depends(get_db)
+async def deploy_model(
+    model_id: str, deployment: DeploymentRequest, db: AsyncSession = Depends(get_db)
 ):
     """
     Update the deployment status of a model.
@@ -133,12 +235,12 @@ def deploy_model(
     service = ModelService(db)
 
     try:
-        model = service.update_deployment_status(model_id, deployment.status)
+        model = await service.update_deployment_status(model_id, deployment.status)
         if not model:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Model not found"
             )
-        return ModelResponse.model_validate(model)
+        return _to_response(model)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -147,13 +249,13 @@ def deploy_model(
 
 
 @router.get("/{model_id}/versions", response_model=list[ModelVersionResponse])
-def list_model_versions(model_id: str, db: Session = Depends(get_db)):
+async def list_model_versions(model_id: str, db: AsyncSession = Depends(get_db)):
     """
     Get all versions of a specific model.
     """
     # First check if model exists
     model_service = ModelService(db)
-    model = model_service.get_model_by_id(model_id)
+    model = await model_service.get_model_by_id(model_id)
 
     if not model:
         raise HTTPException(
@@ -161,9 +263,15 @@ def list_model_versions(model_id: str, db: Session = Depends(get_db)):
         )
 
     version_service = VersionService(db)
-    versions = version_service.get_versions(model_id)
-
-    return [ModelVersionResponse.model_validate(v) for v in versions]
+    versions = await version_service.get_versions(model_id)
+
+    # Serialize in pydantic-core; returning a Response directly skips FastAPI's
+    # second validation pass against response_model
+    items = _VERSION_LIST_ADAPTER.validate_python(versions, from_attributes=True)
+    return Response(
+        content=_VERSION_LIST_ADAPTER.dump_json(items),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -171,25 +279,20 @@ def list_model_versions(model_id: str, db: Session = Depends(get_db)):
     response_model=ModelVersionResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_model_version(
-    model_id: str, version_data: ModelVersionCreate, db: Session = Depends(get_db)
+async def create_model_version(
+    model_id: str, version_data: ModelVersionCreate, db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new version for a model.
     """
-    # First check if model exists
-    model_service = ModelService(db)
-    model = model_service.get_model_by_id(model_id)
-
-    if not model:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Model not found"
-        )
-
     version_service = VersionService(db)
 
     try:
-        version = version_service.create_version(model_id, version_data)
+        version = await version_service.create_version(model_id, version_data)
+        if not version:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Model not found"
+            )
         return ModelVersionResponse.model_validate(version)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
@@ -201,16 +304,33 @@ stats_router = APIRouter(prefix="/stats", tags=["stats"])
 
 
 @stats_router.get("", response_model=DashboardStats)
-def get_dashboard_stats(db: Session = Depends(get_db)):
+async def get_dashboard_stats(
+    if_none_match: Optional[str] = Header(None), db: AsyncSession = Depends(get_db)
+):
     """
     Get aggregated statistics for the dashboard.
     """
+    entry = response_cache.get("stats", None)
+    if entry:
+        return _etag_response(entry, if_none_match)
+
+    generation = response_cache.generation
     service = StatsService(db)
-    stats = service.get_dashboard_stats()
+    stats = await service.get_dashboard_stats()
 
-    return DashboardStats(
+    response = DashboardStats.model_construct(
         total_models=stats["total_models"],
         models_by_status=stats["models_by_status"],
         models_by_framework=stats["models_by_framework"],
-        recent_models=[ModelResponse.model_validate(m) for m in stats["recent_models"]],
+        recent_models=_RECENT_LIST_ADAPTER.validate_python(
+            stats["recent_models"], from_attributes=True
+        ),
+    )
+    entry = response_cache.set(
+        "stats",
+        None,
+        response.model_dump_json().encode(),
+        ttl=settings.response_cache_stats_ttl,
+        generation=generation,
     )
+    return _etag_response(entry, if_none_match)
@@ -1,5 +1,12 @@
 """Services package."""
 
+from app.services.cache import ResponseCache, response_cache
 from app.services.model_service import ModelService, VersionService, StatsService
 
-__all__ = ["ModelService", "VersionService", "StatsService"]
+__all__ = [
+    "ModelService",
+    "VersionService",
+    "StatsService",
+    "ResponseCache",
+    "response_cache",
+]
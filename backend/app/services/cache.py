@@ -0,0 +1,81 @@
+"""
+In-process response cache for read-heavy endpoints.
+Stores serialized JSON bodies with their ETag; cleared on every write.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from app.config import settings
+
+
+class CachedResponse:
+    """A serialized response body and its ETag."""
+
+    __slots__ = ("body", "etag", "expires_at")
+
+    def __init__(self, body: bytes, ttl: float):
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()}"'
+        self.expires_at = time.monotonic() + ttl
+
+
+class ResponseCache:
+    """
+    LRU cache of serialized responses keyed by (namespace, key).
+    Entries expire after their TTL; clear() drops everything.
+
+    clear() also bumps `generation`. A reader records the generation before
+    querying and passes it to set(), so a body built from data read before
+    a concurrent write is never stored.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: OrderedDict[tuple[str, Hashable], CachedResponse] = (
+            OrderedDict()
+        )
+
+    def get(self, namespace: str, key: Hashable) -> Optional[CachedResponse]:
+        """Get a fresh cached response, or None."""
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[(namespace, key)]
+            return None
+        self._entries.move_to_end((namespace, key))
+        return entry
+
+    def set(
+        self,
+        namespace: str,
+        key: Hashable,
+        body: bytes,
+        ttl: float,
+        generation: Optional[int] = None,
+    ) -> CachedResponse:
+        """
+        Cache a serialized response body and return the entry.
+        If `generation` is given and the cache was cleared since, the entry
+        is returned but not stored.
+        """
+        entry = CachedResponse(body, ttl)
+        if generation is not None and generation != self.generation:
+            return entry
+        self._entries[(namespace, key)] = entry
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached responses (called after any write)."""
+        self._entries.clear()
+        self.generation += 1
+
+
+response_cache = ResponseCache(max_entries=settings.response_cache_max_entries)
@@ -3,12 +3,19 @@ Service layer for ML Model business logic.
 Handles CRUD operations and business rules.
 """
 
-from typing import Optional
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Union, cast
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import QueryableAttribute, load_only, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.ml_model import MLModel, ModelVersion
+from app.services.cache import response_cache
 from app.models.schemas import (
     DeploymentStatus,
     Framework,
@@ -17,14 +24,71 @@ from app.models.schemas import (
     ModelVersionCreate,
 )
 
+# Valid deployment status transitions:
+# - development -> staging
+# - staging -> production
+# - any -> archived
+# - archived -> development (reactivation)
+_VALID_TRANSITIONS: dict[str, frozenset[str]] = {
+    DeploymentStatus.DEVELOPMENT.value: frozenset(
+        {DeploymentStatus.STAGING.value, DeploymentStatus.ARCHIVED.value}
+    ),
+    DeploymentStatus.STAGING.value: frozenset(
+        {
+            DeploymentStatus.PRODUCTION.value,
+            DeploymentStatus.DEVELOPMENT.value,
+            DeploymentStatus.ARCHIVED.value,
+        }
+    ),
+    DeploymentStatus.PRODUCTION.value: frozenset(
+        {DeploymentStatus.STAGING.value, DeploymentStatus.ARCHIVED.value}
+    ),
+    DeploymentStatus.ARCHIVED.value: frozenset({DeploymentStatus.DEVELOPMENT.value}),
+}
+
+
+# Columns served by the dashboard's recent models (RecentModelResponse).
+# Mapped attributes at runtime; Column-style declarations need the cast
+_RECENT_MODEL_COLUMNS = cast(
+    "tuple[QueryableAttribute[Any], ...]",
+    (
+        MLModel.id,
+        MLModel.name,
+        MLModel.description,
+        MLModel.framework,
+        MLModel.status,
+        MLModel.current_version,
+        MLModel.author,
+        MLModel.created_at,
+        MLModel.updated_at,
+    ),
+)
+
+
+def _as_uuid(value: Union[str, uuid.UUID]) -> Optional[uuid.UUID]:
+    """Parse an ID from the API; malformed IDs match nothing (None)."""
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _upsert_insert(db: AsyncSession):
+    """Return the dialect's INSERT construct supporting ON CONFLICT DO NOTHING."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
 
 class ModelService:
     """Service class for ML Model operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_models(
+    async def get_models(
         self,
         skip: int = 0,
         limit: int = 20,
@@ -38,80 +102,119 @@ class ModelService:
         Returns:
             Tuple of (models list, total count)
         """
-        query = self.db.query(MLModel)
+        query = select(MLModel)
 
         # Apply filters
         if framework:
-            query = query.filter(MLModel.framework == framework)
+            query = query.where(MLModel.framework == framework)
         if status:
-            query = query.filter(MLModel.status == status)
+            query = query.where(MLModel.status == status)
         if search:
             search_term = f"%{search}%"
-            query = query.filter(
+            query = query.where(
                 (MLModel.name.ilike(search_term))
                 | (MLModel.description.ilike(search_term))
             )
 
-        # Get total count before pagination
-        total = query.count()
-
-        # Apply pagination and ordering
-        models = (
-            query.order_by(MLModel.updated_at.desc()).offset(skip).limit(limit).all()
+        # Apply pagination and ordering; the window count carries the
+        # pre-pagination total on every row so no second query is needed
+        result = await self.db.execute(
+            query.add_columns(func.count().over().label("total"))
+            .options(raiseload("*"))
+            .order_by(MLModel.updated_at.desc())
+            .offset(skip)
+            .limit(limit)
         )
+        rows = result.all()
+        models = [row[0] for row in rows]
+
+        if rows:
+            total = rows[0].total
+        elif skip:
+            # Page past the end: fall back to a plain count
+            total = await self.db.scalar(
+                select(func.count()).select_from(query.subquery())
+            )
+        else:
+            total = 0
 
         return models, total
 
-    def get_model_by_id(self, model_id: str) -> Optional[MLModel]:
+    async def get_model_by_id(
+        self, model_id: Union[str, uuid.UUID]
+    ) -> Optional[MLModel]:
         """Get a single model by ID."""
-        return self.db.query(MLModel).filter(MLModel.id == model_id).first()
+        key = _as_uuid(model_id)
+        if key is None:
+            return None
+        return await self.db.get(MLModel, key, options=[raiseload("*")])
+
+    async def get_model_updated_at(
+        self, model_id: Union[str, uuid.UUID]
+    ) -> Optional[datetime]:
+        """Get only a model's last-modified timestamp (None if not found)."""
+        key = _as_uuid(model_id)
+        if key is None:
+            return None
+        return await self.db.scalar(
+            select(MLModel.updated_at).where(MLModel.id == key)
+        )
 
-    def get_model_by_name(self, name: str) -> Optional[MLModel]:
+    async def get_model_by_name(self, name: str) -> Optional[MLModel]:
         """Get a single model by name."""
-        return self.db.query(MLModel).filter(MLModel.name == name).first()
+        result = await self.db.execute(select(MLModel).where(MLModel.name == name))
+        return result.scalar_one_or_none()
 
-    def create_model(self, model_data: ModelCreate) -> MLModel:
+    async def create_model(self, model_data: ModelCreate) -> MLModel:
         """
         Create a new ML model.
 
         Raises:
             ValueError: If model with same name already exists
         """
-        # Check for duplicate name
-        existing = self.get_model_by_name(model_data.name)
-        if existing:
-            raise ValueError(f"Model with name '{model_data.name}' already exists")
-
-        # Create model
-        db_model = MLModel(
-            name=model_data.name,
-            description=model_data.description,
-            framework=model_data.framework.value,
-            status=DeploymentStatus.DEVELOPMENT.value,
-            current_version=model_data.version,
-            metrics=model_data.metrics,
-            tags=model_data.tags or [],
-            author=model_data.author,
+        # Insert unless the name is taken; an empty RETURNING means conflict
+        insert = _upsert_insert(self.db)
+        result = await self.db.scalars(
+            insert(MLModel)
+            .values(
+                name=model_data.name,
+                description=model_data.description,
+                framework=model_data.framework.value,
+                status=DeploymentStatus.DEVELOPMENT.value,
+                current_version=model_data.version,
+                metrics=model_data.metrics,
+                tags=model_data.tags or [],
+                author=model_data.author,
+            )
+            .on_conflict_do_nothing(index_elements=[MLModel.name])
+            .returning(MLModel)
         )
+        db_model = result.one_or_none()
+        if db_model is None:
+            raise ValueError(f"Model with name '{model_data.name}' already exists")
 
-        self.db.add(db_model)
-        self.db.commit()
-        self.db.refresh(db_model)
-
-        # Create initial version
+        # Create initial version in the same transaction
+        initial_versions = []
         if model_data.version:
-            initial_version = ModelVersion(
-                model_id=db_model.id,
-                version=model_data.version,
-                metrics=model_data.metrics,
-                changelog="Initial version",
+            initial_versions.append(
+                ModelVersion(
+                    model_id=db_model.id,
+                    version=model_data.version,
+                    metrics=model_data.metrics,
+                    changelog="Initial version",
+                )
             )
-            self.db.add(initial_version)
-            self.db.commit()
+        self.db.add_all(initial_versions)
+        set_committed_value(db_model, "versions", initial_versions)
+
+        await self.db.commit()
+        response_cache.clear()
 
         return db_model
 
-    def update_model(self, model_id: str, model_data: ModelUpdate) -> Optional[MLModel]:
+    async def update_model(
+        self, model_id: Union[str, uuid.UUID], model_data: ModelUpdate
+    ) -> Optional[MLModel]:
         """
         Update an existing model.
 
@@ -121,44 +224,56 @@ class ModelService:
         Raises:
             ValueError: If new name conflicts with existing model
         """
-        db_model = self.get_model_by_id(model_id)
+        db_model = await self.get_model_by_id(model_id)
         if not db_model:
             return None
 
-        # Check for name conflict
-        if model_data.name and model_data.name != db_model.name:
-            existing = self.get_model_by_name(model_data.name)
-            if existing:
-                raise ValueError(f"Model with name '{model_data.name}' already exists")
-
         # Update fields
         update_data = model_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_model, field, value)
 
-        self.db.commit()
-        self.db.refresh(db_model)
+        # The unique index on name detects conflicts; no lookup beforehand
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            if "name" not in update_data or update_data["name"] is None:
+                raise
+            raise ValueError(f"Model with name '{model_data.name}' already exists")
+        response_cache.clear()
 
         return db_model
 
-    def delete_model(self, model_id: str) -> bool:
+    async def delete_model(self, model_id: Union[str, uuid.UUID]) -> bool:
         """
         Delete a model and all its versions.
 
         Returns:
             True if deleted, False if not found
         """
-        db_model = self.get_model_by_id(model_id)
+        key = _as_uuid(model_id)
+        if key is None:
+            return False
+        # The delete cascade needs the versions; reload them even if the
+        # model is already in the session with versions unloaded
+        db_model = await self.db.get(
+            MLModel,
+            key,
+            options=[selectinload(MLModel.versions)],
+            populate_existing=True,
+        )
         if not db_model:
             return False
 
-        self.db.delete(db_model)
-        self.db.commit()
+        await self.db.delete(db_model)
+        await self.db.commit()
+        response_cache.clear()
 
         return True
 
-    def update_deployment_status(
-        self, model_id: str, new_status: DeploymentStatus
+    async def update_deployment_status(
+        self, model_id: Union[str, uuid.UUID], new_status: DeploymentStatus
     ) -> Optional[MLModel]:
         """
         Update the deployment status of a model.
@@ -169,115 +284,90 @@ class ModelService:
         Raises:
             ValueError: If status transition is invalid
         """
-        db_model = self.get_model_by_id(model_id)
+        db_model = await self.get_model_by_id(model_id)
         if not db_model:
             return None
 
         # Validate status transition (optional business rule)
-        current_status = DeploymentStatus(db_model.status)
-        if not self._is_valid_status_transition(current_status, new_status):
+        allowed = _VALID_TRANSITIONS.get(str(db_model.status), frozenset())
+        if new_status.value not in allowed:
             raise ValueError(
-                f"Invalid status transition from {current_status.value} to {new_status.value}"
+                f"Invalid status transition from {db_model.status} to {new_status.value}"
             )
 
         db_model.status = new_status.value
-        self.db.commit()
-        self.db.refresh(db_model)
+        await self.db.commit()
+        response_cache.clear()
 
         return db_model
 
-    def _is_valid_status_transition(
-        self, current: DeploymentStatus, new: DeploymentStatus
-    ) -> bool:
-        """
-        Validate deployment status transitions.
-        
-        Valid transitions:
-        - development -> staging
-        - staging -> production
-        - any -> archived
-        - archived -> development (reactivation)
-        """
-        valid_transitions = {
-            DeploymentStatus.DEVELOPMENT: [
-                DeploymentStatus.STAGING,
-                DeploymentStatus.ARCHIVED,
-            ],
-            DeploymentStatus.STAGING: [
-                DeploymentStatus.PRODUCTION,
-                DeploymentStatus.DEVELOPMENT,
-                DeploymentStatus.ARCHIVED,
-            ],
-            DeploymentStatus.PRODUCTION: [
-                DeploymentStatus.STAGING,
-                DeploymentStatus.ARCHIVED,
-            ],
-            DeploymentStatus.ARCHIVED: [
-                DeploymentStatus.DEVELOPMENT,
-            ],
-        }
-
-        return new in valid_transitions.get(current, [])
-
 
 class VersionService:
     """Service class for Model Version operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_versions(self, model_id: str) -> list[ModelVersion]:
+    async def get_versions(
+        self, model_id: Union[str, uuid.UUID]
+    ) -> list[ModelVersion]:
         """Get all versions for a model."""
-        return (
-            self.db.query(ModelVersion)
-            .filter(ModelVersion.model_id == model_id)
+        key = _as_uuid(model_id)
+        if key is None:
+            return []
+        result = await self.db.execute(
+            select(ModelVersion)
+            .options(raiseload("*"))
+            .where(ModelVersion.model_id == key)
             .order_by(ModelVersion.created_at.desc())
-            .all()
         )
+        return list(result.scalars().all())
 
-    def create_version(
-        self, model_id: str, version_data: ModelVersionCreate
-    ) -> ModelVersion:
+    async def create_version(
+        self, model_id: Union[str, uuid.UUID], version_data: ModelVersionCreate
+    ) -> Optional[ModelVersion]:
         """
         Create a new version for a model.
 
+        Returns:
+            Created version or None if the model was not found
+
         Raises:
             ValueError: If version already exists for this model
         """
-        # Check if version already exists
-        existing = (
-            self.db.query(ModelVersion)
-            .filter(
-                ModelVersion.model_id == model_id,
-                ModelVersion.version == version_data.version,
+        key = _as_uuid(model_id)
+        model = await self.db.get(MLModel, key) if key else None
+        if not model:
+            return None
+
+        # Insert unless the version exists; an empty RETURNING means conflict
+        insert = _upsert_insert(self.db)
+        result = await self.db.scalars(
+            insert(ModelVersion)
+            .values(
+                model_id=key,
+                version=version_data.version,
+                metrics=version_data.metrics,
+                changelog=version_data.changelog,
             )
-            .first()
+            .on_conflict_do_nothing(
+                index_elements=[ModelVersion.model_id, ModelVersion.version]
+            )
+            .returning(ModelVersion)
         )
-
-        if existing:
+        db_version = result.one_or_none()
+        if db_version is None:
             raise ValueError(
                 f"Version {version_data.version} already exists for this model"
             )
 
-        # Create version
-        db_version = ModelVersion(
-            model_id=model_id,
-            version=version_data.version,
-            metrics=version_data.metrics,
-            changelog=version_data.changelog,
-        )
-
-        self.db.add(db_version)
-
         # Update model's current version
-        model = self.db.query(MLModel).filter(MLModel.id == model_id).first()
-        if model:
-            model.current_version = version_data.version
-            if version_data.metrics:
-                model.metrics = version_data.metrics
+        model.current_version = version_data.version
+        if version_data.metrics:
+            model.metrics = version_data.metrics
 
-        self.db.commit()
-        self.db.refresh(db_version)
+        await self.db.commit()
+        response_cache.clear()
 
         return db_version
 
@@ -285,40 +375,43 @@ class VersionService:
 class StatsService:
     """Service class for dashboard statistics."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_dashboard_stats(self) -> dict:
+    async def get_dashboard_stats(self) -> dict:
         """Calculate dashboard statistics."""
-        # Total models
-        total_models = self.db.query(func.count(MLModel.id)).scalar()
-
-        # Models by status
-        status_counts = (
-            self.db.query(MLModel.status, func.count(MLModel.id))
-            .group_by(MLModel.status)
-            .all()
+        # One grouped query; each (status, framework) pair feeds both
+        # breakdowns, so at most |statuses| x |frameworks| rows come back
+        grouped_counts = await self.db.execute(
+            select(MLModel.status, MLModel.framework, func.count(MLModel.id))
+            .group_by(MLModel.status, MLModel.framework)
         )
-        models_by_status = {status: count for status, count in status_counts}
-
-        # Models by framework
-        framework_counts = (
-            self.db.query(MLModel.framework, func.count(MLModel.id))
-            .group_by(MLModel.framework)
-            .all()
-        )
-        models_by_framework = {framework: count for framework, count in framework_counts}
-
-        # Recent models (last 5)
-        recent_models = (
-            self.db.query(MLModel)
+        models_by_status: dict[str, int] = {}
+        models_by_framework: dict[str, int] = {}
+        total_models = 0
+        for model_status, framework, count in grouped_counts:
+            models_by_status[model_status] = (
+                models_by_status.get(model_status, 0) + count
+            )
+            models_by_framework[framework] = (
+                models_by_framework.get(framework, 0) + count
+            )
+            total_models += count
+
+        # Recent models (last 5), loading only the summary columns
+        result = await self.db.execute(
+            select(MLModel)
+            .options(
+                load_only(*_RECENT_MODEL_COLUMNS, raiseload=True),
+                raiseload("*"),
+            )
             .order_by(MLModel.updated_at.desc())
             .limit(5)
-            .all()
         )
+        recent_models = list(result.scalars().all())
 
         return {
-            "total_models": total_models or 0,
+            "total_models": total_models,
             "models_by_status": models_by_status,
             "models_by_framework": models_by_framework,
             "recent_models": recent_models,
@@ -2,69 +2,168 @@
 Pytest fixtures and configuration for tests.
 """
 
+import asyncio
+import os
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Use a single in-memory SQLite database (StaticPool) for the app and the
+# tests alike; must be set before the app modules read their settings
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite://"
+
+import orjson
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.database import Base, get_db
-from app.main import app
+from app.database.database import Base, engine, get_db
+from app.main import create_app
+from app.models.ml_model import MLModel
+from app.models.schemas import (
+    DeploymentStatus,
+    ModelCreate,
+    ModelResponse,
+    ModelUpdate,
+    ModelVersionCreate,
+)
+from app.services.cache import response_cache
+from app.services.model_service import ModelService, StatsService, VersionService
 
 
-# Create in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# The sqlite driver's implicit transaction handling breaks SAVEPOINTs;
+# take over BEGIN so each test can run inside a rolled-back transaction
+@event.listens_for(engine.sync_engine, "connect")
+def _disable_driver_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@event.listens_for(engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
-@pytest.fixture(scope="function")
-def db_session():
+async def _create_schema():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+def _savepoint_session(conn) -> AsyncSession:
+    """Session whose commits only release a SAVEPOINT on `conn`."""
+    return AsyncSession(
+        bind=conn,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+async def _warm_statement_cache():
     """
-    Create a fresh database session for each test.
+    Run every service statement shape once in a rolled-back transaction so
+    SQLAlchemy's compiled-statement cache is populated before the tests.
     """
-    # Create tables
-    Base.metadata.create_all(bind=engine)
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = _savepoint_session(conn)
+        try:
+            models = ModelService(session)
+            model = await models.create_model(
+                ModelCreate(name="warmup", framework="sklearn")
+            )
+            await models.get_models(framework="sklearn", search="warmup")
+            await models.get_model_by_id(model.id)
+            await models.get_model_updated_at(model.id)
+            await models.update_model(model.id, ModelUpdate(description="warmup"))
+            await models.update_deployment_status(
+                model.id, DeploymentStatus.STAGING
+            )
+            versions = VersionService(session)
+            await versions.create_version(
+                model.id, ModelVersionCreate(version="1.0.1")
+            )
+            await versions.get_versions(model.id)
+            await StatsService(session).get_dashboard_stats()
+            await models.delete_model(model.id)
+        finally:
+            await session.close()
+            await trans.rollback()
 
-    session = TestingSessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-        # Drop all tables after test
-        Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture(scope="session", autouse=True)
+def db_schema():
+    """
+    Create the schema and warm the statement cache once for the whole
+    test session.
+    """
+    asyncio.run(_create_schema())
+    asyncio.run(_warm_statement_cache())
+    yield
+    asyncio.run(engine.dispose())
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
+async def db_session():
     """
-    Create a test client with database override.
+    Provide a session joined to an outer transaction that is rolled back
+    after each test. Service commits only release a SAVEPOINT, so tests
+    stay isolated without re-creating the schema.
     """
+    # Cached responses would outlive the rolled-back rows
+    response_cache.clear()
 
-    def override_get_db():
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = _savepoint_session(conn)
         try:
-            yield db_session
+            yield session
         finally:
-            pass
+            await session.close()
+            await trans.rollback()
 
-    app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as test_client:
+@pytest.fixture(scope="session")
+def app():
+    """Application under test, built without middleware."""
+    return create_app(include_middleware=False)
+
+
+@pytest.fixture(scope="session")
+def app_client(app):
+    """
+    Create the test client once; app startup/shutdown run a single time,
+    at session start and session finalization.
+    """
+    test_client = TestClient(app)
+    test_client.__enter__()
+    try:
         yield test_client
+    finally:
+        test_client.__exit__(None, None, None)
+
 
+@pytest.fixture(scope="function")
+def client(app, app_client, db_session):
+    """
+    Shared test client with the database dependency bound to this test's
+    session.
+    """
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield app_client
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_model_data():
-    """Sample model data for testing."""
-    return {
+    """
+    Sample model data for testing. Shared read-only across the session;
+    copy with dict(...) before mutating or sending as a request body.
+    """
+    return MappingProxyType({
         "name": "test-model",
         "description": "A test model for unit testing",
         "framework": "sklearn",
@@ -72,11 +171,134 @@ def sample_model_data():
         "metrics": {"accuracy": 0.95, "f1_score": 0.93},
         "tags": ["test", "classification"],
         "author": "Test Author",
-    }
+    })
 
 
 @pytest.fixture
-def sample_model(client, sample_model_data):
+def post_json(client):
+    """
+    POST a JSON payload encoded with orjson (TestClient's json= goes
+    through the stdlib encoder). Used by seeding code.
+    """
+
+    def _post(url: str, payload: Mapping):
+        return client.post(
+            url,
+            content=orjson.dumps(dict(payload)),
+            headers={"content-type": "application/json"},
+        )
+
+    return _post
+
+
+@pytest.fixture
+def sample_model(post_json, sample_model_data):
     """Create a sample model and return its data."""
-    response = client.post("/api/v1/models", json=sample_model_data)
-    return response.json()
+    response = post_json("/api/v1/models", sample_model_data)
+    return orjson.loads(response.content)
+
+
+@pytest.fixture
+async def sample_model_ro(db_session, sample_model_data):
+    """
+    Create the sample model through the service layer for tests that only
+    read it; mutating tests use the API-created `sample_model`.
+    """
+    model = await ModelService(db_session).create_model(
+        ModelCreate(**sample_model_data)
+    )
+    return ModelResponse.model_validate(model).model_dump(mode="json")
+
+
+# Valid path from development to each deployment status
+_STATUS_PATH = {
+    "development": [],
+    "staging": ["staging"],
+    "production": ["staging", "production"],
+    "archived": ["staging", "production", "archived"],
+}
+
+
+@pytest.fixture
+async def model_in_status(db_session, sample_model_data, from_status):
+    """
+    Create a model and advance it to `from_status` through the service
+    layer (no HTTP round-trips). Requires a `from_status` parameter.
+    """
+    service = ModelService(db_session)
+    model = await service.create_model(ModelCreate(**sample_model_data))
+    for step in _STATUS_PATH[from_status]:
+        model = await service.update_deployment_status(
+            model.id, DeploymentStatus(step)
+        )
+    return {"id": str(model.id), "status": model.status}
+
+
+@pytest.fixture
+async def stats_seed(db_session):
+    """
+    Seed two sklearn models and one pytorch model deployed to staging,
+    through the service layer.
+    """
+    service = ModelService(db_session)
+    await service.create_model(ModelCreate(name="sklearn-1", framework="sklearn"))
+    await service.create_model(ModelCreate(name="sklearn-2", framework="sklearn"))
+    pytorch_model = await service.create_model(
+        ModelCreate(name="pytorch-1", framework="pytorch")
+    )
+    await service.update_deployment_status(
+        pytorch_model.id, DeploymentStatus.STAGING
+    )
+
+
+@pytest.fixture
+async def search_seed(db_session):
+    """Bulk-insert two models with distinct names and descriptions."""
+    await db_session.execute(
+        insert(MLModel),
+        [
+            {
+                "name": "customer-churn",
+                "description": "Predicts customer churn",
+                "framework": "sklearn",
+                "status": "development",
+                "current_version": "1.0.0",
+                "tags": [],
+            },
+            {
+                "name": "fraud-detection",
+                "description": "Detects fraudulent transactions",
+                "framework": "pytorch",
+                "status": "development",
+                "current_version": "1.0.0",
+                "tags": [],
+            },
+        ],
+    )
+    await db_session.commit()
+
+
+@pytest.fixture
+def seed_models(db_session):
+    """
+    Factory that bulk-inserts n minimal models named model-0..model-{n-1}
+    in a single executemany (no API round-trips or duplicate checks).
+    """
+
+    async def _seed(n: int, framework: str = "sklearn"):
+        await db_session.execute(
+            insert(MLModel),
+            [
+                {
+                    "name": f"model-{i}",
+                    "framework": framework,
+                    "status": "development",
+                    "current_version": "1.0.0",
+                    "tags": [],
+                }
+                for i in range(n)
+            ],
+        )
+        await db_session.commit()
+
+    return _seed
@@ -3,8 +3,17 @@ Integration tests for API endpoints.
 Tests the full request/response cycle including database.
 """
 
+from collections.abc import Mapping
+from uuid import UUID
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.main import create_app
+from app.models.ml_model import MLModel
+from app.models.schemas import ModelCreate
+from app.services.model_service import ModelService
 
 
 class TestHealthEndpoint:
@@ -19,13 +28,31 @@ class TestHealthEndpoint:
         assert data["status"] == "healthy"
         assert "version" in data
 
+    def test_cors_middleware(self):
+        """Test the production app answers CORS preflight requests."""
+        client = TestClient(create_app())
+        response = client.options(
+            "/health",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
 
+        assert response.status_code == 200
+        assert (
+            response.headers["access-control-allow-origin"]
+            == "http://localhost:3000"
+        )
+
+
+@pytest.mark.xdist_group(name="models")
 class TestModelsEndpoints:
     """Tests for model CRUD endpoints."""
 
-    def test_create_model(self, client: TestClient, sample_model_data: dict):
+    def test_create_model(self, client: TestClient, sample_model_data: Mapping):
         """Test creating a new model."""
-        response = client.post("/api/v1/models", json=sample_model_data)
+        response = client.post("/api/v1/models", json=dict(sample_model_data))
 
         assert response.status_code == 201
         data = response.json()
@@ -49,22 +76,23 @@ class TestModelsEndpoints:
         assert data["current_version"] == "1.0.0"
 
     def test_create_model_duplicate_name(
-        self, client: TestClient, sample_model: dict
+        self, client: TestClient, sample_model_ro: dict
     ):
         """Test that duplicate names are rejected."""
         response = client.post(
             "/api/v1/models",
-            json={"name": sample_model["name"], "framework": "pytorch"},
+            json={"name": sample_model_ro["name"], "framework": "pytorch"},
         )
 
         assert response.status_code == 409
         assert "already exists" in response.json()["detail"]
 
-    def test_create_model_invalid_name(self, client: TestClient):
+    @pytest.mark.parametrize("name", ["invalid@name!", "   ", "-", "_", "- _"])
+    def test_create_model_invalid_name(self, client: TestClient, name: str):
         """Test that invalid names are rejected."""
         response = client.post(
             "/api/v1/models",
-            json={"name": "invalid@name!", "framework": "sklearn"},
+            json={"name": name, "framework": "sklearn"},
         )
 
         assert response.status_code == 422
@@ -78,7 +106,7 @@ class TestModelsEndpoints:
         assert data["items"] == []
         assert data["total"] == 0
 
-    def test_list_models(self, client: TestClient, sample_model: dict):
+    def test_list_models(self, client: TestClient, sample_model_ro: dict):
         """Test listing models."""
         response = client.get("/api/v1/models")
 
@@ -86,16 +114,57 @@ class TestModelsEndpoints:
         data = response.json()
         assert len(data["items"]) == 1
         assert data["total"] == 1
-        assert data["items"][0]["name"] == sample_model["name"]
+        assert data["items"][0]["name"] == sample_model_ro["name"]
 
-    def test_list_models_pagination(self, client: TestClient):
-        """Test model list pagination."""
-        # Create 5 models
-        for i in range(5):
-            client.post(
-                "/api/v1/models",
-                json={"name": f"model-{i}", "framework": "sklearn"},
+    def test_list_models_not_modified(self, client: TestClient, sample_model_ro: dict):
+        """Test that a matching If-None-Match yields 304."""
+        response = client.get("/api/v1/models")
+        etag = response.headers["etag"]
+
+        response = client.get("/api/v1/models", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_list_models_cache_invalidated_on_write(
+        self, client: TestClient, sample_model: dict
+    ):
+        """Test that a write is visible on the next (cached) list request."""
+        client.get("/api/v1/models")
+        client.post(
+            "/api/v1/models",
+            json={"name": "second-model", "framework": "pytorch"},
+        )
+
+        response = client.get("/api/v1/models")
+
+        assert response.json()["total"] == 2
+
+    def test_list_models_write_during_read_not_cached(
+        self, client: TestClient, sample_model: dict, monkeypatch
+    ):
+        """Test that a list read overlapping a write does not cache stale data."""
+        get_models = ModelService.get_models
+
+        async def get_models_then_write(self, *args, **kwargs):
+            result = await get_models(self, *args, **kwargs)
+            # Commit a write after the read's query, before it is cached
+            monkeypatch.setattr(ModelService, "get_models", get_models)
+            await ModelService(self.db).create_model(
+                ModelCreate(name="written-during-read", framework="pytorch")
             )
+            return result
+
+        monkeypatch.setattr(ModelService, "get_models", get_models_then_write)
+        assert client.get("/api/v1/models").json()["total"] == 1
+
+        response = client.get("/api/v1/models")
+
+        assert response.json()["total"] == 2
+
+    async def test_list_models_pagination(self, client: TestClient, seed_models):
+        """Test model list pagination."""
+        await seed_models(5)
 
         # Test pagination
         response = client.get("/api/v1/models?skip=0&limit=2")
@@ -107,16 +176,10 @@ class TestModelsEndpoints:
         data = response.json()
         assert len(data["items"]) == 1
 
-    def test_list_models_filter_by_framework(self, client: TestClient):
+    def test_list_models_filter_by_framework(self, client: TestClient, post_json):
         """Test filtering models by framework."""
-        client.post(
-            "/api/v1/models",
-            json={"name": "sklearn-model", "framework": "sklearn"},
-        )
-        client.post(
-            "/api/v1/models",
-            json={"name": "pytorch-model", "framework": "pytorch"},
-        )
+        post_json("/api/v1/models", {"name": "sklearn-model", "framework": "sklearn"})
+        post_json("/api/v1/models", {"name": "pytorch-model", "framework": "pytorch"})
 
         response = client.get("/api/v1/models?framework=sklearn")
         data = response.json()
@@ -124,19 +187,18 @@ class TestModelsEndpoints:
         assert data["total"] == 1
         assert data["items"][0]["framework"] == "sklearn"
 
-    def test_list_models_search(self, client: TestClient):
+    def test_list_models_search(self, client: TestClient, post_json):
         """Test searching models."""
-        client.post(
+        post_json(
             "/api/v1/models",
-            json={
+            {
                 "name": "customer-churn",
                 "description": "Predicts customer churn",
                 "framework": "sklearn",
             },
         )
-        client.post(
-            "/api/v1/models",
-            json={"name": "fraud-detection", "framework": "pytorch"},
+        post_json(
+            "/api/v1/models", {"name": "fraud-detection", "framework": "pytorch"}
         )
 
         response = client.get("/api/v1/models?search=churn")
@@ -145,14 +207,37 @@ class TestModelsEndpoints:
         assert data["total"] == 1
         assert "churn" in data["items"][0]["name"]
 
-    def test_get_model(self, client: TestClient, sample_model: dict):
+    def test_get_model(self, client: TestClient, sample_model_ro: dict):
         """Test getting a specific model."""
-        response = client.get(f"/api/v1/models/{sample_model['id']}")
+        response = client.get(f"/api/v1/models/{sample_model_ro['id']}")
 
         assert response.status_code == 200
         data = response.json()
-        assert data["id"] == sample_model["id"]
-        assert data["name"] == sample_model["name"]
+        assert data["id"] == sample_model_ro["id"]
+        assert data["name"] == sample_model_ro["name"]
+
+    def test_get_model_not_modified(self, client: TestClient, sample_model_ro: dict):
+        """Test that If-Modified-Since with the current Last-Modified yields 304."""
+        response = client.get(f"/api/v1/models/{sample_model_ro['id']}")
+        last_modified = response.headers["last-modified"]
+
+        response = client.get(
+            f"/api/v1/models/{sample_model_ro['id']}",
+            headers={"If-Modified-Since": last_modified},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_get_model_modified_since(self, client: TestClient, sample_model_ro: dict):
+        """Test that an older If-Modified-Since returns the full model."""
+        response = client.get(
+            f"/api/v1/models/{sample_model_ro['id']}",
+            headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["id"] == sample_model_ro["id"]
 
     def test_get_model_not_found(self, client: TestClient):
         """Test getting a non-existent model."""
@@ -191,6 +276,15 @@ class TestModelsEndpoints:
         assert data["name"] == original_name
         assert data["description"] == "Only description changed"
 
+    def test_update_model_null_name(self, client: TestClient, sample_model: dict):
+        """Test that an explicit null name is rejected, not reported as a conflict."""
+        response = client.put(
+            f"/api/v1/models/{sample_model['id']}",
+            json={"name": None},
+        )
+
+        assert response.status_code == 422
+
     def test_update_model_not_found(self, client: TestClient):
         """Test updating a non-existent model."""
         response = client.put(
@@ -200,15 +294,16 @@ class TestModelsEndpoints:
 
         assert response.status_code == 404
 
-    def test_delete_model(self, client: TestClient, sample_model: dict):
+    async def test_delete_model(
+        self, client: TestClient, db_session: AsyncSession, sample_model: dict
+    ):
         """Test deleting a model."""
         response = client.delete(f"/api/v1/models/{sample_model['id']}")
 
         assert response.status_code == 204
 
         # Verify deletion
-        response = client.get(f"/api/v1/models/{sample_model['id']}")
-        assert response.status_code == 404
+        assert await db_session.get(MLModel, UUID(sample_model["id"])) is None
 
     def test_delete_model_not_found(self, client: TestClient):
         """Test deleting a non-existent model."""
@@ -217,47 +312,28 @@ class TestModelsEndpoints:
         assert response.status_code == 404
 
 
+@pytest.mark.xdist_group(name="deployments")
 class TestDeploymentEndpoints:
     """Tests for deployment status endpoints."""
 
-    def test_deploy_model_to_staging(self, client: TestClient, sample_model: dict):
-        """Test deploying model to staging."""
-        response = client.post(
-            f"/api/v1/models/{sample_model['id']}/deploy",
-            json={"status": "staging"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "staging"
-
-    def test_deploy_model_full_lifecycle(self, client: TestClient, sample_model: dict):
-        """Test full deployment lifecycle."""
-        model_id = sample_model["id"]
-
-        # development -> staging
-        response = client.post(
-            f"/api/v1/models/{model_id}/deploy",
-            json={"status": "staging"},
-        )
-        assert response.status_code == 200
-        assert response.json()["status"] == "staging"
-
-        # staging -> production
-        response = client.post(
-            f"/api/v1/models/{model_id}/deploy",
-            json={"status": "production"},
-        )
-        assert response.status_code == 200
-        assert response.json()["status"] == "production"
-
-        # production -> archived
+    @pytest.mark.parametrize(
+        "from_status,to_status",
+        [
+            ("development", "staging"),
+            ("staging", "production"),
+            ("production", "archived"),
+        ],
+    )
+    def test_deploy_model_lifecycle(
+        self, client: TestClient, model_in_status: dict, to_status: str
+    ):
+        """Test each step of the deployment lifecycle."""
         response = client.post(
-            f"/api/v1/models/{model_id}/deploy",
-            json={"status": "archived"},
+            f"/api/v1/models/{model_in_status['id']}/deploy",
+            json={"status": to_status},
         )
         assert response.status_code == 200
-        assert response.json()["status"] == "archived"
+        assert response.json()["status"] == to_status
 
     def test_deploy_model_invalid_transition(
         self, client: TestClient, sample_model: dict
@@ -273,12 +349,13 @@ class TestDeploymentEndpoints:
         assert "Invalid status transition" in response.json()["detail"]
 
 
+@pytest.mark.xdist_group(name="versions")
 class TestVersionEndpoints:
     """Tests for model version endpoints."""
 
-    def test_list_versions(self, client: TestClient, sample_model: dict):
+    def test_list_versions(self, client: TestClient, sample_model_ro: dict):
         """Test listing model versions."""
-        response = client.get(f"/api/v1/models/{sample_model['id']}/versions")
+        response = client.get(f"/api/v1/models/{sample_model_ro['id']}/versions")
 
         assert response.status_code == 200
         data = response.json()
@@ -338,6 +415,7 @@ class TestVersionEndpoints:
         assert response.status_code == 404
 
 
+@pytest.mark.xdist_group(name="stats")
 class TestStatsEndpoint:
     """Tests for dashboard statistics endpoint."""
 
@@ -352,28 +430,9 @@ class TestStatsEndpoint:
         assert data["models_by_framework"] == {}
         assert data["recent_models"] == []
 
+    @pytest.mark.usefixtures("stats_seed")
     def test_stats_with_models(self, client: TestClient):
         """Test stats with multiple models."""
-        # Create models with different frameworks
-        client.post(
-            "/api/v1/models",
-            json={"name": "sklearn-1", "framework": "sklearn"},
-        )
-        client.post(
-            "/api/v1/models",
-            json={"name": "sklearn-2", "framework": "sklearn"},
-        )
-        pytorch_model = client.post(
-            "/api/v1/models",
-            json={"name": "pytorch-1", "framework": "pytorch"},
-        ).json()
-
-        # Deploy one to staging
-        client.post(
-            f"/api/v1/models/{pytorch_model['id']}/deploy",
-            json={"status": "staging"},
-        )
-
         response = client.get("/api/v1/stats")
 
         assert response.status_code == 200
@@ -384,3 +443,5 @@ class TestStatsEndpoint:
         assert data["models_by_status"]["development"] == 2
         assert data["models_by_status"]["staging"] == 1
         assert len(data["recent_models"]) == 3
+        assert "metrics" not in data["recent_models"][0]
+        assert "tags" not in data["recent_models"][0]
@@ -0,0 +1,131 @@
+"""
+Integration tests for the Alembic migrations.
+Upgrades a database created by the original (string-ID) schema and reads
+it back through the services.
+"""
+
+import asyncio
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models.schemas import ModelVersionCreate
+from app.services.model_service import ModelService, VersionService
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+# Tables as create_all() built them before the UUID/timestamp changes
+LEGACY_SCHEMA = """
+CREATE TABLE ml_models (
+    id VARCHAR(36) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    description TEXT,
+    framework VARCHAR(20) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    current_version VARCHAR(20),
+    metrics JSON,
+    tags JSON,
+    author VARCHAR(100),
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE UNIQUE INDEX ix_ml_models_name ON ml_models (name);
+CREATE TABLE model_versions (
+    id VARCHAR(36) NOT NULL,
+    model_id VARCHAR(36) NOT NULL,
+    version VARCHAR(20) NOT NULL,
+    metrics JSON,
+    changelog TEXT,
+    created_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY(model_id) REFERENCES ml_models (id) ON DELETE CASCADE
+);
+"""
+
+
+def _alembic_config(url: str) -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.set_main_option("sqlalchemy.url", url)
+    return config
+
+
+@pytest.fixture
+def legacy_db(tmp_path: Path):
+    """A SQLite file with the legacy schema and one model with one version."""
+    path = tmp_path / "legacy.db"
+    model_id = str(uuid.uuid4())
+    with sqlite3.connect(path) as conn:
+        conn.executescript(LEGACY_SCHEMA)
+        conn.execute(
+            "INSERT INTO ml_models (id, name, framework, status, current_version,"
+            " tags, created_at, updated_at) VALUES (?, 'legacy-model', 'sklearn',"
+            " 'development', '1.0.0', '[]', '2024-01-01 12:00:00.000000',"
+            " '2024-01-01 12:00:00.000000')",
+            (model_id,),
+        )
+        conn.execute(
+            "INSERT INTO model_versions (id, model_id, version, created_at)"
+            " VALUES (?, ?, '1.0.0', '2024-01-01 12:00:00.000000')",
+            (str(uuid.uuid4()), model_id),
+        )
+    conn.close()
+    return path, uuid.UUID(model_id)
+
+
+class TestMigrations:
+    """Tests for upgrading existing databases."""
+
+    def test_upgrade_legacy_database(self, legacy_db):
+        """Test that legacy string IDs and versions are readable after upgrade."""
+        path, model_id = legacy_db
+        url = f"sqlite+aiosqlite:///{path}"
+
+        command.upgrade(_alembic_config(url), "head")
+
+        async def check():
+            engine = create_async_engine(url)
+            try:
+                async with AsyncSession(engine, expire_on_commit=False) as db:
+                    model = await ModelService(db).get_model_by_id(model_id)
+                    assert model is not None
+                    assert model.name == "legacy-model"
+
+                    versions = VersionService(db)
+                    assert [
+                        v.version for v in await versions.get_versions(model_id)
+                    ] == ["1.0.0"]
+                    with pytest.raises(ValueError, match="already exists"):
+                        await versions.create_version(
+                            model_id, ModelVersionCreate(version="1.0.0")
+                        )
+                    await db.rollback()
+
+                    # Timestamps now default in the database
+                    created = await versions.create_version(
+                        model_id, ModelVersionCreate(version="1.1.0")
+                    )
+                    assert created.created_at is not None
+            finally:
+                await engine.dispose()
+
+        asyncio.run(check())
+
+    def test_upgrade_and_downgrade(self, legacy_db):
+        """Test that the upgrade can be reverted to string IDs."""
+        path, model_id = legacy_db
+        config = _alembic_config(f"sqlite+aiosqlite:///{path}")
+
+        command.upgrade(config, "head")
+        command.downgrade(config, "0001_initial_schema")
+
+        with sqlite3.connect(path) as conn:
+            (stored_id,) = conn.execute("SELECT id FROM ml_models").fetchone()
+        conn.close()
+        assert stored_id == str(model_id)
@@ -0,0 +1,61 @@
+"""
+Unit tests for the in-process response cache.
+"""
+
+from app.services.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Tests for ResponseCache class."""
+
+    def test_get_returns_cached_entry(self):
+        """Test that a stored body is returned with a stable ETag."""
+        cache = ResponseCache(max_entries=4)
+        entry = cache.set("models", ("a",), b'{"total": 1}', ttl=60)
+
+        found = cache.get("models", ("a",))
+
+        assert found is entry
+        assert found.body == b'{"total": 1}'
+        assert found.etag.startswith('"') and found.etag.endswith('"')
+
+    def test_get_expired_entry(self):
+        """Test that entries past their TTL are not returned."""
+        cache = ResponseCache(max_entries=4)
+        cache.set("stats", None, b"{}", ttl=0)
+
+        assert cache.get("stats", None) is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted at capacity."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("models", 1, b"1", ttl=60)
+        cache.set("models", 2, b"2", ttl=60)
+        cache.get("models", 1)
+        cache.set("models", 3, b"3", ttl=60)
+
+        assert cache.get("models", 1) is not None
+        assert cache.get("models", 2) is None
+        assert cache.get("models", 3) is not None
+
+    def test_clear(self):
+        """Test that clear drops every namespace."""
+        cache = ResponseCache(max_entries=4)
+        cache.set("models", 1, b"1", ttl=60)
+        cache.set("stats", None, b"{}", ttl=60)
+
+        cache.clear()
+
+        assert cache.get("models", 1) is None
+        assert cache.get("stats", None) is None
+
+    def test_set_skipped_after_clear(self):
+        """Test that a body read before a clear() is returned but not cached."""
+        cache = ResponseCache(max_entries=4)
+        generation = cache.generation
+
+        cache.clear()  # a write commits while the read is in flight
+        entry = cache.set("models", 1, b"stale", ttl=60, generation=generation)
+
+        assert entry.body == b"stale"
+        assert cache.get("models", 1) is None
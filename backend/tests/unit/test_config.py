@@ -0,0 +1,45 @@
+"""
+Unit tests for application settings.
+"""
+
+import pytest
+
+from app.config import Settings
+
+
+class TestDatabaseUrl:
+    """Tests for DATABASE_URL normalization."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            (
+                "postgresql://user:secret@db:5432/registry",
+                "postgresql+asyncpg://user:secret@db:5432/registry",
+            ),
+            (
+                "postgres://user:secret@db:5432/registry",
+                "postgresql+asyncpg://user:secret@db:5432/registry",
+            ),
+            (
+                "postgresql+psycopg2://user:secret@db/registry",
+                "postgresql+asyncpg://user:secret@db/registry",
+            ),
+            ("sqlite:///./ml_registry.db", "sqlite+aiosqlite:///./ml_registry.db"),
+            ("sqlite://", "sqlite+aiosqlite://"),
+        ],
+    )
+    def test_sync_driver_rewritten(self, url: str, expected: str):
+        """Test that sync driver URLs are rewritten to async drivers."""
+        assert Settings(database_url=url).database_url == expected
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "postgresql+asyncpg://user:secret@db/registry",
+            "sqlite+aiosqlite:///./ml_registry.db",
+        ],
+    )
+    def test_async_driver_unchanged(self, url: str):
+        """Test that URLs already using an async driver are kept as-is."""
+        assert Settings(database_url=url).database_url == url
@@ -2,8 +2,12 @@
 Unit tests for ModelService.
 """
 
+from contextlib import contextmanager
+
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.schemas import (
     DeploymentStatus,
@@ -11,26 +15,60 @@ from app.models.schemas import (
     ModelCreate,
     ModelUpdate,
 )
-from app.services.model_service import ModelService
+from app.services.model_service import ModelService, VersionService
+
+# Enum members bound once at import and reused across tests
+SKLEARN, PYTORCH, TF = Framework.SKLEARN, Framework.PYTORCH, Framework.TENSORFLOW
+STAGING, PRODUCTION = DeploymentStatus.STAGING, DeploymentStatus.PRODUCTION
+
+# Every (from, to) pair outside the allowed deployment lifecycle
+INVALID_TRANSITIONS = [
+    ("development", "development"),
+    ("development", "production"),  # must go through staging
+    ("staging", "staging"),
+    ("production", "development"),
+    ("production", "production"),
+    ("archived", "staging"),
+    ("archived", "production"),
+    ("archived", "archived"),
+]
+
+
+@contextmanager
+def _capture_selects(db_session: AsyncSession):
+    """Collect the SELECT statements executed inside the block."""
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, many):
+        # Ignore the test fixture's SAVEPOINT bookkeeping
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
 
 
 class TestModelService:
     """Tests for ModelService class."""
 
-    def test_create_model_success(self, db_session: Session):
+    async def test_create_model_success(self, db_session: AsyncSession):
         """Test successful model creation."""
         service = ModelService(db_session)
         model_data = ModelCreate(
             name="test-model",
             description="Test description",
-            framework=Framework.SKLEARN,
+            framework=SKLEARN,
             version="1.0.0",
             metrics={"accuracy": 0.95},
             tags=["test"],
             author="Test Author",
         )
 
-        model = service.create_model(model_data)
+        model = await service.create_model(model_data)
 
         assert model.name == "test-model"
         assert model.description == "Test description"
@@ -41,131 +79,162 @@ class TestModelService:
         assert model.tags == ["test"]
         assert model.author == "Test Author"
         assert model.id is not None
+        assert model.id.version == 7
 
-    def test_create_model_duplicate_name(self, db_session: Session):
+    async def test_create_model_duplicate_name(self, db_session: AsyncSession):
         """Test that duplicate model names are rejected."""
         service = ModelService(db_session)
         model_data = ModelCreate(
             name="duplicate-model",
-            framework=Framework.PYTORCH,
+            framework=PYTORCH,
         )
 
         # Create first model
-        service.create_model(model_data)
+        await service.create_model(model_data)
 
         # Attempt to create duplicate
         with pytest.raises(ValueError, match="already exists"):
-            service.create_model(model_data)
+            await service.create_model(model_data)
 
-    def test_get_model_by_id(self, db_session: Session):
+    async def test_get_model_by_id(self, db_session: AsyncSession):
         """Test retrieving model by ID."""
         service = ModelService(db_session)
         model_data = ModelCreate(
             name="find-me",
-            framework=Framework.TENSORFLOW,
+            framework=TF,
         )
 
-        created = service.create_model(model_data)
-        found = service.get_model_by_id(created.id)
+        created = await service.create_model(model_data)
+        found = await service.get_model_by_id(created.id)
 
         assert found is not None
         assert found.id == created.id
         assert found.name == "find-me"
 
-    def test_get_model_by_id_not_found(self, db_session: Session):
+    async def test_get_model_by_id_not_found(self, db_session: AsyncSession):
         """Test that non-existent ID returns None."""
         service = ModelService(db_session)
-        result = service.get_model_by_id("non-existent-id")
+        result = await service.get_model_by_id("non-existent-id")
 
         assert result is None
 
-    def test_get_models_pagination(self, db_session: Session):
+    async def test_get_models_pagination(
+        self, db_session: AsyncSession, seed_models
+    ):
         """Test model list pagination."""
         service = ModelService(db_session)
-
-        # Create 5 models
-        for i in range(5):
-            service.create_model(
-                ModelCreate(name=f"model-{i}", framework=Framework.SKLEARN)
-            )
+        await seed_models(5)
 
         # Get first page
-        models, total = service.get_models(skip=0, limit=2)
+        models, total = await service.get_models(skip=0, limit=2)
         assert len(models) == 2
         assert total == 5
 
         # Get second page
-        models, total = service.get_models(skip=2, limit=2)
+        models, total = await service.get_models(skip=2, limit=2)
         assert len(models) == 2
         assert total == 5
 
-    def test_get_models_filter_by_framework(self, db_session: Session):
+        # Page past the end still reports the total
+        models, total = await service.get_models(skip=10, limit=2)
+        assert models == []
+        assert total == 5
+
+    async def test_get_models_single_query(self, db_session: AsyncSession):
+        """Test that listing models does not also load their versions."""
+        service = ModelService(db_session)
+        await service.create_model(
+            ModelCreate(name="single-query-list", framework=SKLEARN)
+        )
+        db_session.expunge_all()
+
+        with _capture_selects(db_session) as statements:
+            models, total = await service.get_models()
+
+        assert total == 1
+        assert len(statements) == 1
+
+    async def test_unloaded_relationships_raise(self, db_session: AsyncSession):
+        """Test that lazy loads are refused instead of issuing hidden queries."""
+        service = ModelService(db_session)
+        model = await service.create_model(
+            ModelCreate(name="raise-model", framework=SKLEARN)
+        )
+
+        versions = await VersionService(db_session).get_versions(model.id)
+
+        # The model is in the identity map, so a plain lazy load would
+        # succeed silently; raiseload must refuse it
+        with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+            versions[0].model
+
+    async def test_get_model_by_id_single_query(self, db_session: AsyncSession):
+        """Test that fetching one model does not also load its versions."""
+        service = ModelService(db_session)
+        model = await service.create_model(
+            ModelCreate(name="single-query", framework=SKLEARN)
+        )
+        db_session.expunge_all()
+
+        with _capture_selects(db_session) as statements:
+            found = await service.get_model_by_id(model.id)
+
+        assert found.name == "single-query"
+        assert len(statements) == 1
+
+    async def test_get_models_filter_by_framework(self, db_session: AsyncSession):
         """Test filtering models by framework."""
         service = ModelService(db_session)
 
         # Create models with different frameworks
-        service.create_model(
-            ModelCreate(name="sklearn-model", framework=Framework.SKLEARN)
+        await service.create_model(
+            ModelCreate(name="sklearn-model", framework=SKLEARN)
         )
-        service.create_model(
-            ModelCreate(name="pytorch-model", framework=Framework.PYTORCH)
+        await service.create_model(
+            ModelCreate(name="pytorch-model", framework=PYTORCH)
         )
 
-        models, total = service.get_models(framework="sklearn")
+        models, total = await service.get_models(framework="sklearn")
 
         assert total == 1
         assert models[0].framework == "sklearn"
 
-    def test_get_models_filter_by_status(self, db_session: Session):
+    async def test_get_models_filter_by_status(self, db_session: AsyncSession):
         """Test filtering models by status."""
         service = ModelService(db_session)
 
         # Create and update model status
-        model = service.create_model(
-            ModelCreate(name="staging-model", framework=Framework.SKLEARN)
+        model = await service.create_model(
+            ModelCreate(name="staging-model", framework=SKLEARN)
         )
-        service.update_deployment_status(model.id, DeploymentStatus.STAGING)
+        await service.update_deployment_status(model.id, STAGING)
 
-        models, total = service.get_models(status="staging")
+        models, total = await service.get_models(status="staging")
 
         assert total == 1
         assert models[0].status == "staging"
 
-    def test_get_models_search(self, db_session: Session):
+    @pytest.mark.usefixtures("search_seed")
+    async def test_get_models_search(self, db_session: AsyncSession):
         """Test searching models by name and description."""
         service = ModelService(db_session)
 
-        service.create_model(
-            ModelCreate(
-                name="customer-churn",
-                description="Predicts customer churn",
-                framework=Framework.SKLEARN,
-            )
-        )
-        service.create_model(
-            ModelCreate(
-                name="fraud-detection",
-                description="Detects fraudulent transactions",
-                framework=Framework.PYTORCH,
-            )
-        )
-
         # Search by name
-        models, total = service.get_models(search="churn")
+        models, total = await service.get_models(search="churn")
         assert total == 1
-        assert "churn" in models[0].name
+        assert models[0].name == "customer-churn"
 
         # Search by description
-        models, total = service.get_models(search="fraudulent")
+        models, total = await service.get_models(search="fraudulent")
         assert total == 1
-        assert "fraud" in models[0].name
+        assert models[0].name == "fraud-detection"
 
-    def test_update_model(self, db_session: Session):
+    async def test_update_model(self, db_session: AsyncSession):
         """Test updating model properties."""
         service = ModelService(db_session)
 
-        model = service.create_model(
-            ModelCreate(name="update-me", framework=Framework.SKLEARN)
+        model = await service.create_model(
+            ModelCreate(name="update-me", framework=SKLEARN)
         )
 
         update_data = ModelUpdate(
@@ -174,72 +243,83 @@ class TestModelService:
             tags=["updated", "tags"],
         )
 
-        updated = service.update_model(model.id, update_data)
+        updated = await service.update_model(model.id, update_data)
 
         assert updated.name == "updated-name"
         assert updated.description == "New description"
         assert updated.tags == ["updated", "tags"]
 
-    def test_update_model_name_conflict(self, db_session: Session):
+    async def test_update_model_name_conflict(self, db_session: AsyncSession):
         """Test that updating to an existing name is rejected."""
         service = ModelService(db_session)
 
-        service.create_model(ModelCreate(name="existing", framework=Framework.SKLEARN))
-        model2 = service.create_model(
-            ModelCreate(name="rename-me", framework=Framework.SKLEARN)
+        await service.create_model(ModelCreate(name="existing", framework=SKLEARN))
+        model2 = await service.create_model(
+            ModelCreate(name="rename-me", framework=SKLEARN)
         )
 
         with pytest.raises(ValueError, match="already exists"):
-            service.update_model(model2.id, ModelUpdate(name="existing"))
+            await service.update_model(model2.id, ModelUpdate(name="existing"))
+
+    async def test_update_model_other_integrity_error(self, db_session: AsyncSession):
+        """Test that only name collisions are reported as name conflicts."""
+        service = ModelService(db_session)
+        model = await service.create_model(
+            ModelCreate(name="null-name", framework=SKLEARN)
+        )
 
-    def test_delete_model(self, db_session: Session):
+        # Bypass validation to hit the NOT NULL constraint on name
+        with pytest.raises(IntegrityError):
+            await service.update_model(model.id, ModelUpdate.model_construct(name=None))
+
+    async def test_delete_model(self, db_session: AsyncSession):
         """Test deleting a model."""
         service = ModelService(db_session)
 
-        model = service.create_model(
-            ModelCreate(name="delete-me", framework=Framework.SKLEARN)
+        model = await service.create_model(
+            ModelCreate(name="delete-me", framework=SKLEARN)
         )
 
-        result = service.delete_model(model.id)
+        result = await service.delete_model(model.id)
         assert result is True
 
         # Verify deletion
-        found = service.get_model_by_id(model.id)
+        found = await service.get_model_by_id(model.id)
         assert found is None
 
-    def test_delete_model_not_found(self, db_session: Session):
+    async def test_delete_model_not_found(self, db_session: AsyncSession):
         """Test deleting non-existent model returns False."""
         service = ModelService(db_session)
-        result = service.delete_model("non-existent-id")
+        result = await service.delete_model("non-existent-id")
 
         assert result is False
 
-    def test_update_deployment_status(self, db_session: Session):
+    async def test_update_deployment_status(self, db_session: AsyncSession):
         """Test valid deployment status transitions."""
         service = ModelService(db_session)
 
-        model = service.create_model(
-            ModelCreate(name="deploy-me", framework=Framework.SKLEARN)
+        model = await service.create_model(
+            ModelCreate(name="deploy-me", framework=SKLEARN)
         )
 
         # development -> staging
-        updated = service.update_deployment_status(model.id, DeploymentStatus.STAGING)
+        updated = await service.update_deployment_status(model.id, STAGING)
         assert updated.status == "staging"
 
         # staging -> production
-        updated = service.update_deployment_status(
-            model.id, DeploymentStatus.PRODUCTION
+        updated = await service.update_deployment_status(
+            model.id, PRODUCTION
         )
         assert updated.status == "production"
 
-    def test_update_deployment_status_invalid_transition(self, db_session: Session):
+    @pytest.mark.parametrize("from_status,to_status", INVALID_TRANSITIONS)
+    async def test_update_deployment_status_invalid_transition(
+        self, db_session: AsyncSession, model_in_status: dict, to_status: str
+    ):
         """Test invalid deployment status transitions are rejected."""
         service = ModelService(db_session)
 
-        model = service.create_model(
-            ModelCreate(name="invalid-deploy", framework=Framework.SKLEARN)
-        )
-
-        # development -> production (invalid, must go through staging)
         with pytest.raises(ValueError, match="Invalid status transition"):
-            service.update_deployment_status(model.id, DeploymentStatus.PRODUCTION)
+            await service.update_deployment_status(
+                model_in_status["id"], DeploymentStatus(to_status)
+            )
@@ -10,7 +10,7 @@ import {
   Loader2
 } from 'lucide-react';
 import { useStats } from '../hooks/useApi';
-import type { Model } from '../types';
+import type { RecentModel } from '../types';
 
 const statusConfig = {
   development: { icon: FlaskConical, color: 'text-amber-600', bg: 'bg-amber-50' },
@@ -55,7 +55,7 @@ function StatCard({
   );
 }
 
-function ModelCard({ model }: { model: Model }) {
+function ModelCard({ model }: { model: RecentModel }) {
   const config = statusConfig[model.status];
   const StatusIcon = config.icon;
   
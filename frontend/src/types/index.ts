@@ -73,11 +73,13 @@ export interface DeploymentRequest {
   status: DeploymentStatus;
 }
 
+export type RecentModel = Omit<Model, 'metrics' | 'tags'>;
+
 export interface DashboardStats {
   total_models: number;
   models_by_status: Record<string, number>;
   models_by_framework: Record<string, number>;
-  recent_models: Model[];
+  recent_models: RecentModel[];
 }
 
 export interface ApiError {